@@ -7,11 +7,88 @@ and the entire tree structure below that directory.
 """
 
 import os
+import re
 import json
 import fnmatch
+import functools
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, FrozenSet, NamedTuple, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors a JSON parse can raise; ijson's JSONError subclasses Exception
+# directly, not ValueError
+_JSON_ERRORS = (ValueError, OSError)
+if ijson is not None:
+    _JSON_ERRORS = _JSON_ERRORS + (ijson.JSONError,)
+
+
+class ImageRecord:
+    """Compact image record kept as slots instead of a per-image dict.
+
+    The JSON dict is only materialized transiently while serializing, via
+    _json_default, so manifests with many images hold records at a fraction
+    of the dict footprint.
+    """
+
+    __slots__ = ("largeUrl", "attribution", "source", "previewUrl")
+
+    def __init__(
+        self,
+        largeUrl: str,
+        attribution: Dict[str, Any],
+        source: str,
+        previewUrl: str = None,
+    ):
+        self.largeUrl = largeUrl
+        self.attribution = attribution
+        self.source = source
+        self.previewUrl = previewUrl
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "largeUrl": self.largeUrl,
+            "attribution": self.attribution,
+            "source": self.source,
+        }
+        if self.previewUrl is not None:
+            data["previewUrl"] = self.previewUrl
+        return data
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, ImageRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to 2-space-indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_json_default)
+    return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, via orjson when available (skips the text decoder)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def get_git_root() -> Path:
@@ -28,158 +105,384 @@ def get_git_root() -> Path:
         raise RuntimeError("Not in a git repository")
 
 
-def should_ignore(path: Path, ignore_patterns: List[str]) -> bool:
-    """Check if a path should be ignored based on patterns."""
-    path_str = str(path)
+class IgnorePatterns(NamedTuple):
+    """Precompiled ignore patterns, partitioned by shape.
 
-    for pattern in ignore_patterns:
-        # Skip empty lines and comments
-        if not pattern or pattern.strip().startswith("#"):
-            continue
+    Simple patterns resolve through the cheap buckets: plain names like
+    `node_modules` land in `exact_names` (one set lookup) and `*.log`-style
+    globs land in `name_suffixes` (one tuple endswith). Only patterns the
+    buckets cannot express fall through to the `full`/`name` matchers
+    (a Hyperscan database when available, otherwise a joined regex).
+    """
+
+    exact_names: FrozenSet[str]
+    name_suffixes: Tuple[str, ...]
+    full: Any
+    name: Any
+
+
+# Glob metacharacters; a pattern without them matches only literally
+_GLOB_MAGIC = re.compile(r"[*?\[]")
+
+
+# Regex that never matches, used when no ignore patterns are configured.
+_MATCH_NOTHING = re.compile(r"(?!)")
+
+
+def _stop_on_match(*_args):
+    """Hyperscan match handler: terminate the scan on the first match."""
+    return True
+
+
+def _hyperscan_expression(translated: str) -> str:
+    """Convert fnmatch.translate output to Hyperscan-compatible syntax.
+
+    Hyperscan rejects the atomic groups and the (?s:...)\\Z wrapper that
+    fnmatch.translate emits, so rewrite both to anchored plain groups;
+    HS_FLAG_DOTALL supplies the s flag, and atomic groups only prune
+    backtracking, so the matched language is unchanged.
+    """
+    if translated.startswith("(?s:") and translated.endswith(")\\Z"):
+        translated = translated[4:-3]
+    return "^(?:" + translated.replace("(?>", "(?:") + ")$"
+
+
+class _HyperscanMatcher:
+    """Single-scan multi-pattern matcher backed by a Hyperscan database.
+
+    Exposes the same match(str) -> truthy interface as a compiled regex,
+    but scans the input against all glob alternatives in one pass of a
+    JIT-compiled DFA with early termination on the first match.
+    """
+
+    __slots__ = ("_expressions", "_db")
+
+    def __init__(self, expressions: List[str]):
+        self._expressions = expressions
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[e.encode("utf-8") for e in expressions],
+            ids=list(range(len(expressions))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_DOTALL]
+            * len(expressions),
+        )
+
+    def match(self, text: str) -> bool:
+        try:
+            self._db.scan(text.encode("utf-8"), match_event_handler=_stop_on_match)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+
+    def __reduce__(self):
+        # Databases cannot be pickled; rebuild from the expressions when a
+        # matcher crosses a process boundary (worker initargs)
+        return (_HyperscanMatcher, (self._expressions,))
+
+# Directories already pruned from the walk; anything below them is ignored
+# without re-matching the patterns.
+_ignored_dirs = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _should_ignore_cached(
+    path_str: str, name: str, ignore_patterns: IgnorePatterns
+) -> bool:
+    """Match a path against the compiled patterns, caching by path string."""
+    # Cheap buckets first; most patterns (and most hits) are plain names
+    # or *.ext globs
+    if name in ignore_patterns.exact_names:
+        return True
+    if name.endswith(ignore_patterns.name_suffixes):
+        return True
+    return bool(
+        ignore_patterns.full.match(path_str) or ignore_patterns.name.match(name)
+    )
 
-        pattern = pattern.strip()
-        if not pattern:
+
+def should_ignore(path: "os.PathLike", ignore_patterns: IgnorePatterns) -> bool:
+    """Check if a path (Path or DirEntry) should be ignored based on patterns."""
+    path_str = os.fspath(path)
+    # Everything below an already-ignored directory is ignored too.
+    if os.path.dirname(path_str) in _ignored_dirs:
+        return True
+    return _should_ignore_cached(path_str, path.name, ignore_patterns)
+
+
+def walk_scandir(root: Path, ignore_patterns: IgnorePatterns):
+    """Walk a directory tree with os.scandir, yielding (dir_path, entries).
+
+    Unlike os.walk this keeps the DirEntry objects, so later is_file/is_dir
+    checks reuse the file type the kernel already returned from getdents64
+    instead of issuing an extra stat per entry. Ignored directories are
+    pruned before descending and recorded in _ignored_dirs.
+
+    os.scandir already batches enumeration through getdents64 in C with a
+    kernel-sized buffer; a raw ctypes/cffi getdents64 wrapper was evaluated
+    and rejected since it would only move dirent parsing from C into Python
+    bytecode.
+    """
+    stack = [Path(root)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
             continue
 
+        yield dir_path, entries
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Never descend into VCS metadata; .git alone can hold
+                # thousands of pack/object files
+                if entry.name in (".git", ".github"):
+                    continue
+                if should_ignore(entry, ignore_patterns):
+                    _ignored_dirs.add(entry.path)
+                else:
+                    stack.append(Path(entry.path))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_ignore_patterns(path_str: str, mtime_ns: int) -> IgnorePatterns:
+    """Parse and compile a .manifest-ignore file.
+
+    Each glob pattern is translated to a regex once via fnmatch.translate and
+    all alternatives are joined into two compiled matchers, so the per-path
+    check is a single C-level scan instead of several fnmatch calls. Cached
+    per (path, mtime) so repeated loads — e.g. one pool per batch — reuse
+    the compiled object instead of re-reading and re-compiling.
+    """
+    patterns = []
+    if mtime_ns >= 0:
+        try:
+            with open(path_str, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    # Skip empty lines and comments
+                    if line and not line.startswith("#"):
+                        patterns.append(line)
+        except OSError:
+            pass
+
+    exact_names = set()
+    name_suffixes = []
+    full_patterns = []
+    name_patterns = []
+    for pattern in patterns:
         # Handle directory patterns with trailing slash
         clean_pattern = pattern.rstrip("/")
 
-        # Check various pattern matches
-        if (
-            fnmatch.fnmatch(path_str, pattern)
-            or fnmatch.fnmatch(path.name, clean_pattern)
-            or fnmatch.fnmatch(path_str, f"*/{clean_pattern}")
-            or fnmatch.fnmatch(path_str, f"*/{clean_pattern}/*")
-        ):
-            return True
+        # Partition by shape: plain names and `*X` suffix globs get O(1)
+        # buckets (directory pruning covers their `*/name/*` descendants);
+        # anything else goes through the compiled matcher
+        if "/" not in clean_pattern:
+            if not _GLOB_MAGIC.search(clean_pattern):
+                exact_names.add(clean_pattern)
+                continue
+            if clean_pattern.startswith("*") and not _GLOB_MAGIC.search(
+                clean_pattern[1:]
+            ):
+                name_suffixes.append(clean_pattern[1:])
+                continue
 
-    return False
+        full_patterns.extend(
+            [pattern, f"*/{clean_pattern}", f"*/{clean_pattern}/*"]
+        )
+        name_patterns.append(clean_pattern)
+
+    def compile_alternatives(globs: List[str]) -> Any:
+        if not globs:
+            return _MATCH_NOTHING
+        translated = [fnmatch.translate(g) for g in globs]
+        if hyperscan is not None:
+            try:
+                return _HyperscanMatcher(
+                    [_hyperscan_expression(t) for t in translated]
+                )
+            except hyperscan.error:
+                # Unsupported construct; fall back to the joined regex
+                pass
+        return re.compile("|".join(f"(?:{t})" for t in translated), re.DOTALL)
+
+    return IgnorePatterns(
+        exact_names=frozenset(exact_names),
+        name_suffixes=tuple(name_suffixes),
+        full=compile_alternatives(full_patterns),
+        name=compile_alternatives(name_patterns),
+    )
+
+
+def load_ignore_patterns(repo_root: Path) -> IgnorePatterns:
+    """Load precompiled ignore patterns from the repo's .manifest-ignore."""
+    ignore_file = repo_root / ".manifest-ignore"
+    try:
+        mtime_ns = ignore_file.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    return _compile_ignore_patterns(str(ignore_file), mtime_ns)
 
 
-def load_ignore_patterns(repo_root: Path) -> List[str]:
-    """Load ignore patterns from .manifest-ignore file."""
-    ignore_file = repo_root / ".manifest-ignore"
-    if not ignore_file.exists():
-        return []
+# Image file extensions included in manifests (lowercase)
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
 
-    with open(ignore_file, "r") as f:
-        return [line.strip() for line in f.readlines()]
+# Thumbnail filename endings; _thumb only ever appears right before the
+# extension, so one tuple endswith identifies thumbnails
+_THUMB_SUFFIXES = tuple("_thumb" + ext for ext in _IMAGE_EXTENSIONS)
 
+# Blacklist lookup structure: (exact filenames, base names without extension)
+Blacklist = Tuple[FrozenSet[str], FrozenSet[str]]
 
-def load_blacklist(dir_path: Path) -> List[str]:
-    """Load blacklisted files from blacklist.json in the directory."""
-    blacklist_file = dir_path / "blacklist.json"
-    if not blacklist_file.exists():
-        return []
+_EMPTY_BLACKLIST: Blacklist = (frozenset(), frozenset())
 
-    try:
-        with open(blacklist_file, "r") as f:
-            blacklist_data = json.load(f)
-            if isinstance(blacklist_data, list):
-                return blacklist_data
-            return []
-    except (json.JSONDecodeError, OSError):
-        return []
 
+def _stem(filename: str) -> str:
+    """Base name without the final extension, without allocating a PurePath."""
+    head, sep, _ = filename.rpartition(".")
+    return head if sep else filename
 
-def load_metadata(dir_path: Path) -> Dict[str, Any]:
-    """Load metadata from metadata.json in the directory."""
-    metadata_file = dir_path / "metadata.json"
-    if not metadata_file.exists():
-        return {}
 
+@functools.lru_cache(maxsize=16384)
+def _load_blacklist_cached(path_str: str, mtime_ns: int) -> Blacklist:
+    """Parse blacklist.json; cached per (path, mtime) so an unchanged file
+    is only parsed once per process."""
     try:
-        with open(metadata_file, "r") as f:
-            metadata = json.load(f)
-            return metadata
-    except (json.JSONDecodeError, OSError):
-        return {}
+        blacklist_data = loads_json(Path(path_str).read_bytes())
+        if not isinstance(blacklist_data, list):
+            return _EMPTY_BLACKLIST
+    except (ValueError, OSError):
+        return _EMPTY_BLACKLIST
 
+    return (
+        frozenset(blacklist_data),
+        frozenset(_stem(name) for name in blacklist_data),
+    )
 
-def get_image_attribution(filename: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
-    """Get attribution information for a specific image from metadata."""
-    if not metadata or "images" not in metadata:
-        return {}
-    
-    # Find the image in the metadata
-    for image_info in metadata["images"]:
-        if image_info.get("originalFile") == filename:
-            attribution = image_info.get("attribution", {})
-            return {
-                "attribution": attribution,
-                "source": image_info.get("source", ""),
-                "isDefaultImage": image_info.get("isDefaultImage", False),
-                "thumbnailFile": image_info.get("thumbnailFile", "")
-            }
-    
-    return {}
 
+def load_blacklist(dir_path: Path) -> Blacklist:
+    """Load blacklisted names and their stems from blacklist.json in the directory."""
+    blacklist_file = dir_path / "blacklist.json"
+    try:
+        mtime_ns = blacklist_file.stat().st_mtime_ns
+    except OSError:
+        return _EMPTY_BLACKLIST
+    return _load_blacklist_cached(str(blacklist_file), mtime_ns)
+
+
+# Above this size metadata.json is parsed incrementally instead of slurped
+_LARGE_METADATA_BYTES = 1 << 20
+
+# Parsed metadata: (defaultImage filename or None, {originalFile: entry})
+MetadataIndex = Tuple[Any, Dict[str, Any]]
+
+_EMPTY_METADATA: MetadataIndex = (None, {})
+
+
+def _stream_metadata_index(path_str: str) -> MetadataIndex:
+    """Build the metadata index with ijson without materializing the document.
+
+    Each element of the top-level "images" array is assembled on the fly and
+    inserted into the index as soon as its closing brace is parsed, so peak
+    memory stays at one image record plus the index itself.
+    """
+    default_image = None
+    attr_index = {}
+    builder = None
+    with open(path_str, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == "images.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "images.item" and event == "end_map":
+                    image_info = builder.value
+                    builder = None
+                    if "originalFile" in image_info:
+                        attr_index[image_info["originalFile"]] = image_info
+            elif prefix == "defaultImage":
+                default_image = value
+    return default_image, attr_index
+
+
+@functools.lru_cache(maxsize=16384)
+def _load_metadata_cached(path_str: str, mtime_ns: int, size: int) -> MetadataIndex:
+    """Parse metadata.json into an index; cached per (path, mtime, size)."""
+    try:
+        if ijson is not None and size >= _LARGE_METADATA_BYTES:
+            return _stream_metadata_index(path_str)
+
+        metadata = loads_json(Path(path_str).read_bytes())
+        if not isinstance(metadata, dict):
+            return _EMPTY_METADATA
+        attr_index = {
+            image_info["originalFile"]: image_info
+            for image_info in metadata.get("images", ())
+            if "originalFile" in image_info
+        }
+        return metadata.get("defaultImage"), attr_index
+    except _JSON_ERRORS:
+        return _EMPTY_METADATA
+
+
+def load_metadata(dir_path: Path) -> MetadataIndex:
+    """Load the (defaultImage, attribution index) pair for a directory."""
+    metadata_file = dir_path / "metadata.json"
+    try:
+        stat = metadata_file.stat()
+    except OSError:
+        return _EMPTY_METADATA
+    return _load_metadata_cached(str(metadata_file), stat.st_mtime_ns, stat.st_size)
 
 
 
-def is_blacklisted(filename: str, blacklist: List[str]) -> bool:
+def is_blacklisted(filename: str, blacklist: Blacklist) -> bool:
     """Check if a filename is blacklisted, including base name and thumbnail matching."""
+    names, stems = blacklist
+
     # Direct filename match
-    if filename in blacklist:
+    if filename in names:
         return True
-    
-    # Get the base name (hash) of the current file
-    if "_thumb" in filename:
-        # For thumbnails, extract the base name without _thumb
-        base_name = Path(filename.replace("_thumb", "")).stem
-    else:
-        # For regular files, get the base name
-        base_name = Path(filename).stem
-    
-    # Check if any blacklisted file has the same base name (hash)
-    for blacklisted_file in blacklist:
-        blacklisted_base = Path(blacklisted_file).stem
-        if base_name == blacklisted_base:
-            return True
-    
-    return False
 
+    # Get the base name (hash) of the current file; thumbnails share the
+    # base name of the file they were generated from
+    if filename.endswith(_THUMB_SUFFIXES):
+        base_name = filename[: filename.rfind("_thumb")]
+    else:
+        base_name = _stem(filename)
 
-def list_directory_contents(dir_path: Path, ignore_patterns: List[str], blacklist: List[str] = None) -> List[Path]:
-    """List contents of a directory, filtering out ignored and blacklisted items."""
-    if not dir_path.exists() or not dir_path.is_dir():
-        return []
+    return base_name in stems
 
-    if blacklist is None:
-        blacklist = []
 
-    items = []
-    for item in dir_path.iterdir():
-        # Skip manifest.json, blacklist.json, and .git
-        if item.name in ["manifest.json", "blacklist.json", ".git"]:
-            continue
+def _write_manifest_bytes(manifest_file: Path, new_bytes: bytes) -> None:
+    """Write manifest bytes to a tempfile and rename it into place.
 
-        # Check if item should be ignored
-        if should_ignore(item, ignore_patterns):
-            continue
-
-        # Check if item is blacklisted (including base name matching)
-        if is_blacklisted(item.name, blacklist):
-            continue
-
-        items.append(item)
-
-    return sorted(items, key=lambda x: x.name.lower())
+    Uses os.open/os.write directly so the payload goes out in one write
+    syscall without the buffered-IO layer, and os.replace so a crash cannot
+    leave a torn manifest behind.
+    """
+    tmp_path = str(manifest_file) + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, new_bytes)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, manifest_file)
 
 
 def generate_manifest(
-    dir_path: Path, ignore_patterns: List[str], repo_root: Path
+    dir_path: Path,
+    entries: List["os.DirEntry"],
+    ignore_patterns: IgnorePatterns,
+    repo_root: Path,
 ) -> None:
     """Generate manifest.json for a directory."""
-    # Skip if this is a git directory
-    if ".git" in str(dir_path):
-        return
-
     manifest_file = dir_path / "manifest.json"
     
     # Load blacklist and metadata for this directory
     blacklist = load_blacklist(dir_path)
-    metadata = load_metadata(dir_path)
+    default_image_filename, attr_index = load_metadata(dir_path)
 
     # Get the scientific name from the directory name
     scientific_name = dir_path.name
@@ -187,44 +490,58 @@ def generate_manifest(
     # Get all image files in the directory
     images = []
     default_image_data = None
-    default_image_filename = None
-    
-    if metadata and "defaultImage" in metadata:
-        default_image_filename = metadata["defaultImage"]
 
-    # Get directory contents
-    items = list_directory_contents(dir_path, ignore_patterns, blacklist)
+    # Single sorted pass over the entries: extension, thumbnail, ignore and
+    # blacklist filtering fused with image building, no intermediate list
+    for item in sorted(entries, key=lambda e: e.name.casefold()):
+        name = item.name
 
-    # Process only image files (skip thumbnails)
-    for item in items:
-        if item.is_file() and item.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-            # Skip thumbnails
-            if "_thumb" in item.name:
-                continue
-                
-            # Get attribution information
-            attribution_info = get_image_attribution(item.name, metadata)
-            
-            # Create image data with new format
-            image_data = {
-                "largeUrl": f"species-images/{scientific_name}/{item.name}",
-                "attribution": attribution_info.get("attribution", {}),
-                "source": attribution_info.get("source", "")
-            }
-            
+        # Only image files make it into the manifest; this also drops
+        # manifest.json, blacklist.json and metadata.json
+        if not name.lower().endswith(_IMAGE_EXTENSIONS):
+            continue
+        if not item.is_file(follow_symlinks=False):
+            continue
+
+        # Skip thumbnails
+        if "_thumb" in name:
+            continue
+
+        if should_ignore(item, ignore_patterns) or is_blacklisted(name, blacklist):
+            continue
+
+        # Get attribution information
+        image_info = attr_index.get(name)
+
+        # Create image record with new format
+        if image_info is not None:
             # Add preview URL if thumbnail exists
-            thumbnail_file = attribution_info.get("thumbnailFile", "")
-            if thumbnail_file:
-                image_data["previewUrl"] = f"species-images/{scientific_name}/{thumbnail_file}"
-            
-            # Check if this is the default image
-            if item.name == default_image_filename:
-                default_image_data = image_data
-            else:
-                images.append(image_data)
-
-    # Sort images by largeUrl
-    images.sort(key=lambda x: x["largeUrl"])
+            thumbnail_file = image_info.get("thumbnailFile", "")
+            image_data = ImageRecord(
+                largeUrl=f"species-images/{scientific_name}/{name}",
+                attribution=image_info.get("attribution", {}),
+                source=image_info.get("source", ""),
+                previewUrl=(
+                    f"species-images/{scientific_name}/{thumbnail_file}"
+                    if thumbnail_file
+                    else None
+                ),
+            )
+        else:
+            image_data = ImageRecord(
+                largeUrl=f"species-images/{scientific_name}/{name}",
+                attribution={},
+                source="",
+            )
+
+        # Check if this is the default image
+        if name == default_image_filename:
+            default_image_data = image_data
+        else:
+            images.append(image_data)
+
+    # images is already sorted: list_directory_contents sorts by name and
+    # largeUrl only varies in the name suffix within a directory
 
     # Create manifest
     manifest = {
@@ -232,9 +549,43 @@ def generate_manifest(
         "images": images,
     }
 
-    # Write manifest file
-    with open(manifest_file, "w") as f:
-        json.dump(manifest, f, indent=2)
+    new_bytes = dumps_json(manifest)
+
+    # Skip the write when the manifest is unchanged, avoiding mtime churn
+    # and spurious git diffs; compare size first so most runs never read
+    try:
+        if (
+            manifest_file.stat().st_size == len(new_bytes)
+            and manifest_file.read_bytes() == new_bytes
+        ):
+            return
+    except OSError:
+        pass
+
+    _write_manifest_bytes(manifest_file, new_bytes)
+
+
+# Per-process state, set once by _init_worker so each task only has to
+# pickle a directory path instead of the compiled patterns.
+_worker_ignore_patterns = None
+_worker_repo_root = None
+
+
+def _init_worker(ignore_patterns: IgnorePatterns, repo_root: Path) -> None:
+    global _worker_ignore_patterns, _worker_repo_root
+    _worker_ignore_patterns = ignore_patterns
+    _worker_repo_root = repo_root
+
+
+def _generate_manifest_worker(dir_path_str: str) -> None:
+    """Scan one directory and generate its manifest (runs in a worker process)."""
+    dir_path = Path(dir_path_str)
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    generate_manifest(dir_path, entries, _worker_ignore_patterns, _worker_repo_root)
 
 
 def main():
@@ -252,24 +603,25 @@ def main():
             print("Error: species-images directory not found", file=sys.stderr)
             sys.exit(1)
 
-        # Find all directories in the species-images folder
+        # Find all directories in the species-images folder; walk_scandir
+        # prunes ignored directories before descending
         directories = []
-        for root, dirs, files in os.walk(species_images_dir):
-            # Skip ignored directories
-            dirs[:] = [
-                d for d in dirs if not should_ignore(Path(root) / d, ignore_patterns)
-            ]
-
-            dir_path = Path(root)
+        for dir_path, entries in walk_scandir(species_images_dir, ignore_patterns):
             if not should_ignore(dir_path, ignore_patterns):
-                directories.append(dir_path)
+                directories.append(str(dir_path))
 
-        # Generate manifests for all directories in species-images
-        for dir_path in directories:
-            generate_manifest(dir_path, ignore_patterns, repo_root)
+        # Generate manifests for all directories in species-images, one
+        # worker process per core; each directory is independent
+        with ProcessPoolExecutor(
+            initializer=_init_worker, initargs=(ignore_patterns, repo_root)
+        ) as executor:
+            list(executor.map(_generate_manifest_worker, directories, chunksize=64))
 
         print(f"Generated manifest.json files for {len(directories)} directories in species-images")
 
+        _load_blacklist_cached.cache_clear()
+        _load_metadata_cached.cache_clear()
+
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)